@@ -8,17 +8,34 @@ envbee API Client.
 
 This class provides methods to interact with the envbee API, allowing users to retrieve
 and manage environment variables through secure authenticated requests.
+
+A single client can be shared by several threads without extra locking: requests go
+through a pooled requests.Session, diskcache keeps a SQLite connection per thread, and
+every HMAC signature is computed on a copy of the precomputed key state, which is never
+mutated. The in-memory cache is the only shared mutable state: every change to it,
+including the LRU bookkeeping done on reads, is made under a lock.
 """
 
 import hashlib
 import hmac
-import json
 import logging
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import platformdirs
 import requests
 from diskcache import Cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .exceptions.envbee_exceptions import RequestError, RequestTimeoutError
 from .metadata import Metadata
@@ -26,9 +43,40 @@ from .utils import add_querystring
 
 logger = logging.getLogger(__name__)
 
+# Requests are always sent without a body, so the signed content is the empty JSON
+# object and its hash is a constant: hashlib.md5(b"{}").hexdigest()
+_EMPTY_BODY_MD5_HEX = b"99914b932bd37a50b983c5e7c90ae93b"
+
+
+@dataclass(slots=True)
+class _RequestResult:
+    """Outcome of an API request: the JSON payload if it succeeded, the error otherwise."""
+
+    ok: bool
+    data: dict | None = None
+    error: Exception | None = None
+    etag: str | None = None
+    not_modified: bool = False
+
 
 class Envbee:
     __BASE_URL: str = "https://api.envbee.dev"
+    __USER_AGENT: str = "envbee-sdk-python"
+    __CACHE_SETTINGS: dict = {
+        "sqlite_journal_mode": "wal",
+        "sqlite_synchronous": 1,  # NORMAL, safe when combined with WAL
+        "sqlite_cache_size": 8192,
+        "sqlite_mmap_size": 64 * 1024 * 1024,
+        "eviction_policy": "least-recently-stored",
+        "size_limit": 64 * 1024 * 1024,
+        "timeout": 1.0,
+        # Variable values are small, keep them inline in SQLite instead of in files
+        "disk_min_file_size": 2**20,
+        # Do not cull while writing, the size limit is enforced on open and close instead
+        "cull_limit": 0,
+    }
+    __MEMORY_CACHE_SIZE: int = 256
+    __MEMORY_CACHE_TTL: float = 60.0
 
     def __init__(
         self, api_key: str, api_secret: bytes | bytearray, base_url: str = None
@@ -44,8 +92,94 @@ class Envbee:
         self.__base_url = base_url or self.__BASE_URL
         self.__api_key = api_key
         self.__api_secret = api_secret
+        self.__hmac_template = hmac.new(self.__api_secret, digestmod=hashlib.sha256)
+        self.__session = self._create_session()
+        self.__cache_dir = platformdirs.user_cache_dir(
+            appname=self.__api_key, appauthor="envbee"
+        )
+        self.__cache = self._open_cache()
+        self.__memory_cache: OrderedDict[str, tuple[float, dict, str | None]] = (
+            OrderedDict()
+        )
+        self.__memory_cache_lock = threading.Lock()
+        logger.debug("Using cache directory: %s", self.__cache_dir)
         logger.info("Envbee client initialized with base URL: %s", self.__base_url)
 
+    def __enter__(self) -> "Envbee":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections and the local cache held by the client."""
+        logger.debug("Closing Envbee client.")
+        self.__session.close()
+        if self.__cache is None:
+            return
+        try:
+            self.__cache.cull()
+        except Exception as e:
+            logger.error("Error culling the cache: %s", e, exc_info=True)
+        self.__cache.close()
+
+    def _open_cache(self) -> Cache | None:
+        """Open the local cache used as a fallback when the API is unavailable.
+
+        Writes do not cull the cache, so the size limit is enforced once here, which also
+        covers clients that are never closed.
+
+        Returns:
+            Cache: The opened cache, or None if the cache directory cannot be used, in
+                which case the client works without the disk cache.
+        """
+        try:
+            cache = Cache(self.__cache_dir, **self.__CACHE_SETTINGS)
+        except Exception as e:
+            logger.error(
+                "Error opening cache at %s, disk cache disabled: %s",
+                self.__cache_dir,
+                e,
+                exc_info=True,
+            )
+            return None
+        try:
+            cache.cull()
+        except Exception as e:
+            logger.error("Error culling the cache: %s", e, exc_info=True)
+        return cache
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by all API requests.
+
+        Reusing a single session keeps connections alive between requests, so only the
+        first request to the API pays the TCP and TLS handshakes.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            # Only retry gateway errors: timeouts and connection failures fall back
+            # to the cache right away instead of being repeated
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=False,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {"x-api-key": self.__api_key, "User-Agent": self.__USER_AGENT}
+        )
+        return session
+
     def _generate_hmac_header(self, url_path: str) -> str:
         """Generate an HMAC authentication header for the specified URL path.
 
@@ -58,93 +192,234 @@ class Envbee:
         Returns:
             str: The formatted HMAC authorization header.
         """
-        logger.debug("Generating HMAC header for URL path: %s", url_path)
-        try:
-            hmac_obj = hmac.new(self.__api_secret, digestmod=hashlib.sha256)
-            current_time = str(int(time.time() * 1000))
-            hmac_obj.update(current_time.encode("utf-8"))
-            hmac_obj.update(b"GET")
-            hmac_obj.update(url_path.encode("utf-8"))
-            content = json.dumps({}).encode("utf-8")
-            content_hash = hashlib.md5()
-            content_hash.update(content)
-            hmac_obj.update(content_hash.hexdigest().encode("utf-8"))
-            auth_header = "HMAC %s:%s" % (current_time, hmac_obj.hexdigest())
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Generating HMAC header for URL path: %s", url_path)
+        hmac_obj = self.__hmac_template.copy()
+        current_time = time.time_ns() // 1_000_000
+        hmac_obj.update(b"%d" % current_time)
+        hmac_obj.update(b"GET")
+        hmac_obj.update(url_path.encode("utf-8"))
+        hmac_obj.update(_EMPTY_BODY_MD5_HEX)
+        sig_hex = hmac_obj.hexdigest()
+        auth_header = f"HMAC {current_time}:{sig_hex}"
+        if debug:
             logger.debug("HMAC header generated successfully.")
-            return auth_header
-        except Exception as e:
-            logger.error("Error generating HMAC header: %s", e, exc_info=True)
-            raise
+        return auth_header
 
-    def _send_request(self, url: str, hmac_header: str, timeout: int = 2):
+    def _send_request(
+        self, url: str, hmac_header: str, timeout: int = 2, etag: str = None
+    ) -> _RequestResult:
         """Send a GET request to the specified URL with the given HMAC header.
 
         This method performs an authenticated API request and handles response status codes.
-        If the request is successful, it returns the JSON response; otherwise, it raises an error.
+        Failures are returned rather than raised, so callers can fall back to the cache
+        without paying for exception handling.
 
         Args:
             url (str): The URL to which the GET request will be sent.
             hmac_header (str): The HMAC authentication header for the request.
             timeout (int, optional): The maximum time to wait for the request to complete (in seconds). Defaults to 2.
+            etag (str, optional): The ETag of the cached response. If the resource has not
+                changed, the API answers 304 Not Modified without a body.
 
         Returns:
-            dict: The JSON response from the API if the request is successful.
-
-        Raises:
-            RequestError: If the response status code indicates a failed request.
-            RequestTimeoutError: If the request times out.
+            _RequestResult: The JSON response and its ETag if the request is successful, or
+                not_modified set if the resource matches the given ETag. Otherwise, a
+                RequestError if the response status code indicates a failed request or a
+                RequestTimeoutError if the request timed out.
         """
-        logger.debug("Sending request to URL: %s", url)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Sending request to URL: %s", url)
+        headers = {"Authorization": hmac_header}
+        if etag:
+            headers["If-None-Match"] = etag
         try:
-            response = requests.get(
-                url,
-                headers={"Authorization": hmac_header, "x-api-key": self.__api_key},
-                timeout=timeout,
-            )
-            logger.debug("Received response with status code: %s", response.status_code)
-            if response.status_code == 200:
-                logger.debug("Request successful. Returning JSON response.")
-                return response.json()
-            else:
-                logger.error(
-                    "Request to failed with status code: %s. Response text: %s",
-                    response.status_code,
-                    response.text,
-                )
-                raise RequestError(
-                    response.status_code, f"Failed request: {response.text}"
-                )
+            response = self.__session.get(url, headers=headers, timeout=timeout)
         except requests.exceptions.Timeout:
             logger.error("Request to %s timed out after %d seconds", url, timeout)
-            raise RequestTimeoutError(
-                f"Request to {url} timed out after {timeout} seconds"
+            return _RequestResult(
+                False,
+                error=RequestTimeoutError(
+                    f"Request to {url} timed out after {timeout} seconds"
+                ),
             )
-        except Exception as e:
-            logger.critical(
-                "Unexpected error during request to %s: %s", url, e, exc_info=True
+        except requests.exceptions.RequestException as e:
+            logger.error("Request to %s failed: %s", url, e)
+            return _RequestResult(False, error=e)
+
+        if response.status_code == 304 and etag:
+            if debug:
+                logger.debug("Resource not modified since ETag %s.", etag)
+            return _RequestResult(True, etag=etag, not_modified=True)
+
+        if response.status_code != 200:
+            logger.error(
+                "Request to failed with status code: %s. Response text: %s",
+                response.status_code,
+                response.text,
+            )
+            return _RequestResult(
+                False,
+                error=RequestError(
+                    response.status_code, f"Failed request: {response.text}"
+                ),
             )
-            raise e
 
-    def _cache_variable(self, variable_name: str, variable_content: dict):
+        try:
+            data = json_loads(response.content)
+        except ValueError as e:
+            logger.error("Invalid JSON response from %s: %s", url, e)
+            return _RequestResult(False, error=e)
+        if debug:
+            logger.debug("Request successful. Returning JSON response.")
+        return _RequestResult(True, data=data, etag=response.headers.get("ETag"))
+
+    def _remember_variable(
+        self, variable_name: str, variable_content: dict, etag: str = None
+    ):
+        """Store a variable's content in the in-memory cache in front of the disk cache.
+
+        The least recently used entries are dropped once the cache is full. Writes are
+        serialized between threads.
+
+        Args:
+            variable_name (str): The name of the variable to store.
+            variable_content (dict): The content of the variable to store.
+            etag (str, optional): The ETag of the API response the content comes from.
+        """
+        with self.__memory_cache_lock:
+            self.__memory_cache[variable_name] = (
+                time.monotonic(),
+                variable_content,
+                etag,
+            )
+            self.__memory_cache.move_to_end(variable_name)
+            if len(self.__memory_cache) > self.__MEMORY_CACHE_SIZE:
+                self.__memory_cache.popitem(last=False)
+
+    def _recall_variable(self, variable_name: str) -> tuple[dict, str | None] | None:
+        """Retrieve a variable's content and ETag from the in-memory cache.
+
+        The lookup itself is lockless. Dropping an expired entry and refreshing its LRU
+        position are done under the cache lock, like every other change to the cache.
+
+        Args:
+            variable_name (str): The name of the variable to retrieve.
+
+        Returns:
+            tuple[dict, str | None]: The content of the variable and its ETag, or None if
+                it is not stored or has expired.
+        """
+        entry = self.__memory_cache.get(variable_name)
+        if entry is None:
+            return None
+        stored_at, variable_content, etag = entry
+        expired = time.monotonic() - stored_at > self.__MEMORY_CACHE_TTL
+        with self.__memory_cache_lock:
+            # Only act on the entry that was read, another thread may have replaced
+            # or evicted it in the meantime
+            if self.__memory_cache.get(variable_name) is entry:
+                if expired:
+                    del self.__memory_cache[variable_name]
+                else:
+                    self.__memory_cache.move_to_end(variable_name)
+        if expired:
+            return None
+        return variable_content, etag
+
+    def _get_cached_variable(self, variable_name: str) -> tuple[dict | None, str | None]:
+        """Retrieve a variable's content and ETag from the memory or disk cache.
+
+        Args:
+            variable_name (str): The name of the variable to retrieve.
+
+        Returns:
+            tuple[dict | None, str | None]: The cached content of the variable and its ETag,
+                or None for both if the variable is not cached.
+        """
+        entry = self._recall_variable(variable_name)
+        if entry is not None:
+            return entry
+        if self.__cache is None:
+            return None, None
+        try:
+            variable_content, etag = self.__cache.get(variable_name, tag=True)
+        except Exception as e:
+            logger.error(
+                "Error retrieving variable %s from cache: %s",
+                variable_name,
+                e,
+                exc_info=True,
+            )
+            return None, None
+        if variable_content is not None:
+            self._remember_variable(variable_name, variable_content, etag)
+        return variable_content, etag
+
+    def _cache_variable(
+        self, variable_name: str, variable_content: dict, etag: str = None
+    ):
         """Cache a variable locally for future retrieval.
 
+        The disk cache is only written when the content differs from the one
+        recently cached for the same variable.
+
         Args:
             variable_name (str): The name of the variable to cache.
             variable_content (str): The content of the variable to cache.
+            etag (str, optional): The ETag of the API response the content comes from.
         """
-        logger.debug("Caching variable: %s", variable_name)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Caching variable: %s", variable_name)
+        if variable_content is None:
+            logger.warning("Variable %s has no content, not caching it.", variable_name)
+            return
+        if self._recall_variable(variable_name) == (variable_content, etag):
+            if debug:
+                logger.debug(
+                    "Variable %s unchanged, skipping cache write.", variable_name
+                )
+            return
         try:
-            app_cache_dir = platformdirs.user_cache_dir(
-                appname=self.__api_key, appauthor="envbee"
-            )
-            with Cache(app_cache_dir) as reference:
-                reference.set(variable_name, variable_content)
-            logger.debug("Variable %s cached successfully.", variable_name)
+            if self.__cache is not None:
+                self.__cache.set(variable_name, variable_content, tag=etag)
+            self._remember_variable(variable_name, variable_content, etag)
+            if debug:
+                logger.debug("Variable %s cached successfully.", variable_name)
         except Exception as e:
             logger.error(
                 "Error caching variable %s: %s", variable_name, e, exc_info=True
             )
 
+    def _cache_variables(self, variables: list[dict]):
+        """Cache a list of variables locally in a single transaction.
+
+        Args:
+            variables (list[dict]): The variables to cache, each with a name and a content.
+        """
+        logger.debug("Caching %d variables.", len(variables))
+        changed = []
+        for v in variables:
+            entry = self._recall_variable(v["name"])
+            if entry is None or entry[0] != v["content"]:
+                changed.append(v)
+        if not changed:
+            logger.debug("Variables unchanged, skipping cache write.")
+            return
+        try:
+            if self.__cache is not None:
+                with self.__cache.transact():
+                    for v in changed:
+                        self.__cache.set(v["name"], v["content"])
+            for v in changed:
+                self._remember_variable(v["name"], v["content"])
+            logger.debug("%d variables cached successfully.", len(changed))
+        except Exception as e:
+            logger.error("Error caching variables: %s", e, exc_info=True)
+
     def _get_variable_from_cache(self, variable_name: str) -> str | int | bool:
         """Retrieve a variable's content from the local cache.
 
@@ -154,25 +429,16 @@ class Envbee:
         Returns:
             str: The cached content of the variable, or None if not found.
         """
-        logger.debug("Retrieving variable from cache: %s", variable_name)
-        try:
-            app_cache_dir = platformdirs.user_cache_dir(
-                appname=self.__api_key, appauthor="envbee"
-            )
-            with Cache(app_cache_dir) as reference:
-                content = reference.get(variable_name)
-            if content:
-                logger.debug("Variable %s retrieved from cache.", variable_name)
-            else:
-                logger.warning("Variable %s not found in cache.", variable_name)
-            return content.get("value")
-        except Exception as e:
-            logger.error(
-                "Error retrieving variable %s from cache: %s",
-                variable_name,
-                e,
-                exc_info=True,
-            )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Retrieving variable from cache: %s", variable_name)
+        content, _ = self._get_cached_variable(variable_name)
+        if not isinstance(content, dict):
+            logger.warning("Variable %s not found in cache.", variable_name)
+            return None
+        if debug:
+            logger.debug("Variable %s retrieved from cache.", variable_name)
+        return content.get("value")
 
     def _get_variables_from_cache(
         self, offset: int = 0, limit: int = 50
@@ -189,30 +455,41 @@ class Envbee:
         logger.debug(
             "Retrieving variables from cache with offset=%d, limit=%s", offset, limit
         )
+        if self.__cache is None:
+            logger.warning("Disk cache disabled, no cached variables available.")
+            return [], Metadata(limit, offset, 0)
         try:
-            app_cache_dir = platformdirs.user_cache_dir(
-                appname=self.__api_key, appauthor="envbee"
+            # Read keys and values in a single query instead of one lookup per key
+            rows = self.__cache._sql(
+                "SELECT key, raw, mode, filename, value FROM Cache"
+                " WHERE expire_time IS NULL OR expire_time > ?"
+                " ORDER BY rowid",
+                (time.time(),),
+            ).fetchall()
+            disk = self.__cache.disk
+            all_values = [
+                {
+                    "name": disk.get(key, raw),
+                    "content": disk.fetch(mode, filename, value, False),
+                }
+                for key, raw, mode, filename, value in rows
+            ]
+
+            # Apply offset and limit
+            paginated_values = (
+                all_values[offset : offset + limit]
+                if limit is not None
+                else all_values[offset:]
             )
-            with Cache(app_cache_dir) as reference:
-                all_values = [
-                    {"name": k, "content": reference[k]} for k in list(reference)
-                ]
-
-                # Apply offset and limit
-                paginated_values = (
-                    all_values[offset : offset + limit]
-                    if limit is not None
-                    else all_values[offset:]
-                )
 
-                return paginated_values, Metadata(limit, offset, len(all_values))
+            return paginated_values, Metadata(limit, offset, len(all_values))
         except Exception as e:
             logger.error(
                 "Error retrieving variables from cache: %s",
                 e,
                 exc_info=True,
             )
-            return [], Metadata()
+            return [], Metadata(limit, offset, 0)
 
     def get_variable(self, variable_name: str) -> str | int | bool:
         """Retrieve a variable's value by its name.
@@ -226,36 +503,71 @@ class Envbee:
         Returns:
             The value of the variable.
         """
-        logger.debug("Fetching variable: %s", variable_name)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Fetching variable: %s", variable_name)
         url_path = f"/v1/variables-values/{variable_name}"
         hmac_header = self._generate_hmac_header(url_path)
         final_url = f"{self.__base_url}{url_path}"
-        try:
-            response = self._send_request(final_url, hmac_header)
-            self._cache_variable(variable_name, response.get("content"))
-            logger.debug("Variable %s fetched successfully.", variable_name)
-            return response.get("content").get("value")
-        except Exception:
+        cached_content, etag = self._get_cached_variable(variable_name)
+        result = self._send_request(
+            final_url, hmac_header, etag=etag if cached_content is not None else None
+        )
+        if not result.ok:
             logger.warning(
                 "Failed to fetch variable %s from API. Falling back to cache.",
                 variable_name,
             )
             return self._get_variable_from_cache(variable_name)
 
-    def get_variables(
-        self, offset: int = None, limit: int = None
-    ) -> tuple[list[dict], Metadata]:
-        """Retrieve a list of variables with optional pagination.
+        if result.not_modified:
+            if debug:
+                logger.debug("Variable %s not modified, using cache.", variable_name)
+            return cached_content.get("value")
 
-        This method fetches variables from the API and caches them locally.
-        If an error happens, value is retrieved from cache.
+        try:
+            content = result.data["content"]
+            value = content.get("value")
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning(
+                "Invalid response for variable %s from API (%r). Falling back to cache.",
+                variable_name,
+                e,
+            )
+            return self._get_variable_from_cache(variable_name)
+
+        self._cache_variable(variable_name, content, result.etag)
+        if debug:
+            logger.debug("Variable %s fetched successfully.", variable_name)
+        return value
+
+    def get_variables_bulk(self, variable_names: list[str]) -> dict:
+        """Retrieve the values of several variables by their names.
+
+        Each variable is requested with the client's pooled connection and precomputed
+        HMAC key, falling back to the local cache like get_variable.
+
+        Args:
+            variable_names (list[str]): The names of the variables to retrieve.
+
+        Returns:
+            dict: The value of each variable, keyed by its name.
+        """
+        logger.debug("Fetching %d variables by name.", len(variable_names))
+        return {name: self.get_variable(name) for name in variable_names}
+
+    def _fetch_variables(
+        self, offset: int = None, limit: int = None
+    ) -> tuple[list[dict], Metadata] | None:
+        """Fetch a page of variables from the API and cache them locally.
 
         Args:
             offset (int, optional): The starting point for fetching variables.
             limit (int, optional): The maximum number of variables to retrieve.
 
         Returns:
-            list[dict]: A list of dictionaries containing variables and their values.
+            tuple[list[dict], Metadata]: The variables of the page and the pagination metadata,
+                or None if the request failed.
         """
         logger.debug("Fetching variables with offset=%s, limit=%s", offset, limit)
         url_path = "/v1/variables"
@@ -268,15 +580,80 @@ class Envbee:
         url_path = add_querystring(url_path, params)
         hmac_header = self._generate_hmac_header(url_path)
         final_url = f"{self.__base_url}{url_path}"
+        result = self._send_request(final_url, hmac_header)
+        if not result.ok:
+            logger.warning("Failed to fetch variables from API: %s", result.error)
+            return None
+
         try:
-            result_json = self._send_request(final_url, hmac_header)
-            metadata = Metadata(**result_json.get("metadata", {}))
-            data = result_json.get("data", [])
-            for v in data:
-                self._cache_variable(v["name"], v["content"])
-            logger.debug("Fetched and cached %d variables.", len(data))
-            return data, metadata
-        except Exception as e:
-            logger.warning("Failed to fetch variables from API: %s", e, exc_info=True)
+            metadata = Metadata(**result.data["metadata"])
+            data = list(result.data["data"])
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning("Invalid variables response from API: %r", e)
+            return None
+        if not all(isinstance(v, dict) and "name" in v and "content" in v for v in data):
+            logger.warning("Invalid variables response from API: missing name or content")
+            return None
+
+        self._cache_variables(data)
+        logger.debug("Fetched and cached %d variables.", len(data))
+        return data, metadata
+
+    def get_variables(
+        self, offset: int = None, limit: int = None
+    ) -> tuple[list[dict], Metadata]:
+        """Retrieve a list of variables with optional pagination.
+
+        This method fetches variables from the API and caches them locally.
+        If an error happens, value is retrieved from cache.
+
+        Args:
+            offset (int, optional): The starting point for fetching variables.
+            limit (int, optional): The maximum number of variables to retrieve.
+
+        Returns:
+            list[dict]: A list of dictionaries containing variables and their values.
+        """
+        page = self._fetch_variables(offset, limit)
+        if page is None:
             logger.warning("Falling back to cached variables.")
             return self._get_variables_from_cache()
+        return page
+
+    def iter_variables(self, page_size: int = 200) -> Iterator[dict]:
+        """Iterate over all the variables, fetching them from the API page by page.
+
+        The next page is requested in the background while the current one is being
+        consumed. If a page cannot be fetched, the cached variables that have not been
+        yielded yet are retrieved from cache instead.
+
+        Args:
+            page_size (int, optional): The number of variables requested per page. Defaults to 200.
+
+        Yields:
+            dict: Each variable and its value.
+        """
+        logger.debug("Iterating variables with page_size=%d", page_size)
+        offset = 0
+        yielded = set()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._fetch_variables, offset, page_size)
+            while future is not None:
+                page = future.result()
+                if page is None:
+                    logger.warning("Falling back to cached variables.")
+                    # The cache is not ordered like the API, so the offset cannot be
+                    # reused there: skip the variables already yielded instead
+                    cached, _ = self._get_variables_from_cache(0, None)
+                    yield from (v for v in cached if v["name"] not in yielded)
+                    return
+
+                data, metadata = page
+                offset += len(data)
+                future = None
+                # The API may cap the page below page_size, rely on the total instead
+                if data and offset < metadata.total:
+                    future = executor.submit(self._fetch_variables, offset, page_size)
+                for v in data:
+                    yielded.add(v["name"])
+                    yield v
@@ -16,6 +16,7 @@ def add_querystring(url: str, params: dict):
 
     This function updates the query string of a URL with the provided parameters.
     If the URL already has a query string, the parameters will be added to it.
+    URLs without a query string or fragment are extended directly, without parsing.
 
     Args:
         url (str): The original URL to which query parameters will be added.
@@ -25,6 +26,11 @@ def add_querystring(url: str, params: dict):
         str: The updated URL with the added query parameters.
     """
     try:
+        if not params:
+            return url
+        if "?" not in url and "#" not in url:
+            return f"{url}?{urlencode(params, doseq=True)}"
+
         url_parts = list(urlparse(url))
 
         query = dict(parse_qs(url_parts[4]))  # url_parts[4] is actual query string
@@ -14,6 +14,9 @@ setup(
         "platformdirs",
         "requests",
     ],
+    extras_require={
+        "orjson": ["orjson"],
+    },
     include_package_data=True,
     packages=find_packages(exclude=["*.pyc", "__pycache__", "*/__pycache__"]),
     classifiers=[
@@ -21,5 +24,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
 )
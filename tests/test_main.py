@@ -1,8 +1,21 @@
+import hashlib
+import hmac
+import json
 import logging
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+import requests
+
+from envbee_sdk.exceptions.envbee_exceptions import RequestTimeoutError
 from envbee_sdk.main import Envbee
 
 logger = logging.getLogger(__name__)
@@ -19,46 +32,55 @@ class Test(TestCase):
         """Clean up the test environment after each test."""
         super().tearDown()
 
-    @patch("envbee_sdk.main.requests.get")
+    @patch("envbee_sdk.main.requests.Session.get")
     def test_get_variable_simple(self, mock_get: MagicMock):
         """Test getting a variable successfully from the API."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "name": "Var1",
-            "content": {"value": "Value1"},
-        }
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {
+                "name": "Var1",
+                "content": {"value": "Value1"},
+            }
+        ).encode("utf-8")
 
         eb = Envbee("1__local", b"key---1")
         self.assertEqual("Value1", eb.get_variable("Var1"))
 
-    @patch("envbee_sdk.main.requests.get")
+    @patch("envbee_sdk.main.requests.Session.get")
     def test_get_variable_cache(self, mock_get: MagicMock):
         """Test retrieving a variable from cache when the API request fails."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "name": "Var1",
-            "content": {"value": "ValueFromCache"},
-        }
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {
+                "name": "Var1",
+                "content": {"value": "ValueFromCache"},
+            }
+        ).encode("utf-8")
 
         eb = Envbee("1__local", b"key---1")
         self.assertEqual("ValueFromCache", eb.get_variable("Var1"))
 
         mock_get.return_value.status_code = 500
-        mock_get.return_value.json.return_value = {}
+        mock_get.return_value.content = b"{}"
         eb = Envbee("1__local", b"key---1")
         self.assertEqual("ValueFromCache", eb.get_variable("Var1"))
 
-    @patch("envbee_sdk.main.requests.get")
+    @patch("envbee_sdk.main.requests.Session.get")
     def test_get_variables_simple(self, mock_get: MagicMock):
         """Test getting multiple variables successfully from the API."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "metadata": {"limit": 1, "offset": 10, "total": 100},
-            "data": [
-                {"name": "VAR1", "content": {"value": "VALUE1"}},
-                {"name": "VAR2", "content": {"value": [1, 2, 3]}},
-            ],
-        }
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {
+                "metadata": {"limit": 1, "offset": 10, "total": 100},
+                "data": [
+                    {"name": "VAR1", "content": {"value": "VALUE1"}},
+                    {"name": "VAR2", "content": {"value": [1, 2, 3]}},
+                ],
+            }
+        ).encode("utf-8")
 
         eb = Envbee("1__local", b"key---1")
         variables, md = eb.get_variables()
@@ -68,17 +90,20 @@ class Test(TestCase):
         )
         self.assertAlmostEqual({"limit": 1, "offset": 10, "total": 100}, asdict(md))
 
-    @patch("envbee_sdk.main.requests.get")
+    @patch("envbee_sdk.main.requests.Session.get")
     def test_get_variables_cache(self, mock_get: MagicMock):
         """Test retrieving multiple variables from cache when the API request fails."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "metadata": {"limit": 50, "offset": 0, "total": 2},
-            "data": [
-                {"name": "V1", "content": {"value": "VALUE_CACHE"}},
-                {"name": "V2", "content": {"value": [3, 4, 5]}},
-            ],
-        }
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {
+                "metadata": {"limit": 50, "offset": 0, "total": 2},
+                "data": [
+                    {"name": "V1", "content": {"value": "VALUE_CACHE"}},
+                    {"name": "V2", "content": {"value": [3, 4, 5]}},
+                ],
+            }
+        ).encode("utf-8")
 
         eb = Envbee("1__local", b"key---1")
         variables, md = eb.get_variables()
@@ -89,7 +114,7 @@ class Test(TestCase):
         self.assertAlmostEqual({"limit": 50, "offset": 0, "total": 2}, asdict(md))
 
         mock_get.return_value.status_code = 500
-        mock_get.return_value.json.return_value = {}
+        mock_get.return_value.content = b"{}"
         eb = Envbee("1__local", b"key---1")
         variables, md = eb.get_variables()
         self.assertEqual(
@@ -99,3 +124,337 @@ class Test(TestCase):
         self.assertAlmostEqual(
             {"limit": 50, "offset": 0, "total": md.total}, asdict(md)
         )
+
+    @patch("envbee_sdk.main.requests.Session.close")
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_context_manager_closes_session(
+        self, mock_get: MagicMock, mock_close: MagicMock
+    ):
+        """Test that the client releases its HTTP session when used as a context manager."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {
+                "name": "Var1",
+                "content": {"value": "Value1"},
+            }
+        ).encode("utf-8")
+
+        with Envbee("1__local", b"key---1") as eb:
+            self.assertEqual("Value1", eb.get_variable("Var1"))
+            mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+    @patch("envbee_sdk.main.time.time_ns", return_value=1700000000123456789)
+    def test_generate_hmac_header(self, mock_time: MagicMock):
+        """Test that the HMAC header signs timestamp, method, path and content hash."""
+        expected = hmac.new(b"key---1", digestmod=hashlib.sha256)
+        expected.update(b"1700000000123")
+        expected.update(b"GET")
+        expected.update(b"/v1/variables-values/Var1")
+        expected.update(hashlib.md5(b"{}").hexdigest().encode("utf-8"))
+
+        eb = Envbee("1__local", b"key---1")
+        header = eb._generate_hmac_header("/v1/variables-values/Var1")
+        self.assertEqual(f"HMAC 1700000000123:{expected.hexdigest()}", header)
+        # The precomputed key state must not be mutated between requests
+        self.assertEqual(header, eb._generate_hmac_header("/v1/variables-values/Var1"))
+
+    @patch("envbee_sdk.main.Cache.set")
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_cache_variable_skips_unchanged(
+        self, mock_get: MagicMock, mock_set: MagicMock
+    ):
+        """Test that an unchanged variable is not written to the disk cache again."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {
+                "name": "Var1",
+                "content": {"value": "Unchanged"},
+            }
+        ).encode("utf-8")
+
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual("Unchanged", eb.get_variable("Var1"))
+        self.assertEqual("Unchanged", eb.get_variable("Var1"))
+        mock_set.assert_called_once_with("Var1", {"value": "Unchanged"}, tag=None)
+
+        mock_get.return_value.content = json.dumps(
+            {
+                "name": "Var1",
+                "content": {"value": "Changed"},
+            }
+        ).encode("utf-8")
+        self.assertEqual("Changed", eb.get_variable("Var1"))
+        self.assertEqual(2, mock_set.call_count)
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_iter_variables(self, mock_get: MagicMock):
+        """Test iterating over all variables across several pages."""
+        pages = [
+            {
+                "metadata": {"limit": 2, "offset": 0, "total": 3},
+                "data": [
+                    {"name": "IT1", "content": {"value": "VALUE1"}},
+                    {"name": "IT2", "content": {"value": "VALUE2"}},
+                ],
+            },
+            {
+                "metadata": {"limit": 2, "offset": 2, "total": 3},
+                "data": [{"name": "IT3", "content": {"value": "VALUE3"}}],
+            },
+        ]
+        responses = []
+        for page in pages:
+            response = MagicMock(status_code=200, headers={})
+            response.content = json.dumps(page).encode("utf-8")
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        eb = Envbee("1__local", b"key---1")
+        variables = list(eb.iter_variables(page_size=2))
+        self.assertEqual(["IT1", "IT2", "IT3"], [v["name"] for v in variables])
+        self.assertEqual(2, mock_get.call_count)
+        self.assertTrue(mock_get.call_args.args[0].endswith("offset=2&limit=2"))
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variables_bulk(self, mock_get: MagicMock):
+        """Test getting several variables by name."""
+        responses = []
+        for name in ("BULK1", "BULK2"):
+            response = MagicMock(status_code=200, headers={})
+            response.content = json.dumps(
+                {"name": name, "content": {"value": f"{name}_VALUE"}}
+            ).encode("utf-8")
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual(
+            {"BULK1": "BULK1_VALUE", "BULK2": "BULK2_VALUE"},
+            eb.get_variables_bulk(["BULK1", "BULK2"]),
+        )
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variable_timeout_cache(self, mock_get: MagicMock):
+        """Test retrieving a variable from cache when the API request times out."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {"name": "VarTimeout", "content": {"value": "CachedBeforeTimeout"}}
+        ).encode("utf-8")
+
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual("CachedBeforeTimeout", eb.get_variable("VarTimeout"))
+
+        mock_get.side_effect = requests.exceptions.Timeout()
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual("CachedBeforeTimeout", eb.get_variable("VarTimeout"))
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variable_threads(self, mock_get: MagicMock):
+        """Test sharing a single client between several threads."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {"name": "VarThreads", "content": {"value": "Shared"}}
+        ).encode("utf-8")
+
+        eb = Envbee("1__local", b"key---1")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(eb.get_variable, ["VarThreads"] * 64))
+        self.assertEqual(["Shared"] * 64, values)
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variable_not_modified(self, mock_get: MagicMock):
+        """Test that a cached variable is revalidated with its ETag."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"ETag": '"etag-1"'}
+        mock_get.return_value.content = json.dumps(
+            {"name": "VarETag", "content": {"value": "Revalidated"}}
+        ).encode("utf-8")
+
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual("Revalidated", eb.get_variable("VarETag"))
+
+        mock_get.return_value.status_code = 304
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = b""
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual("Revalidated", eb.get_variable("VarETag"))
+        self.assertEqual(
+            '"etag-1"', mock_get.call_args.kwargs["headers"]["If-None-Match"]
+        )
+
+    def test_send_request_timeout_not_retried(self):
+        """Test that a read timeout is reported once, without retrying the request."""
+        hits = []
+
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                time.sleep(0.5)
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        with Envbee("1__local", b"key---1", base_url=base_url) as eb:
+            result = eb._send_request(f"{base_url}/v1/variables", "HMAC 0:0", timeout=0.1)
+        self.assertFalse(result.ok)
+        self.assertIsInstance(result.error, RequestTimeoutError)
+        self.assertEqual(1, len(hits))
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    @patch("envbee_sdk.main.Cache", side_effect=NotADirectoryError())
+    def test_cache_unavailable(self, mock_cache: MagicMock, mock_get: MagicMock):
+        """Test that the client works from the API when the cache cannot be opened."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {"name": "VarNoCache", "content": {"value": "FromApi"}}
+        ).encode("utf-8")
+
+        with Envbee("1__local", b"key---1") as eb:
+            self.assertEqual("FromApi", eb.get_variable("VarNoCache"))
+
+            mock_get.return_value.status_code = 500
+            variables, md = eb.get_variables()
+            self.assertEqual([], variables)
+            self.assertEqual(0, md.total)
+
+    def test_send_request_connection_error(self):
+        """Test that a connection failure is reported as a requests error, without retrying."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        base_url = f"http://127.0.0.1:{port}"
+        with Envbee("1__local", b"key---1", base_url=base_url) as eb:
+            result = eb._send_request(f"{base_url}/v1/variables", "HMAC 0:0")
+        self.assertFalse(result.ok)
+        self.assertIsInstance(result.error, requests.exceptions.ConnectionError)
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variable_malformed_cache(self, mock_get: MagicMock):
+        """Test retrieving a variable from cache when the API response has no content."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(
+            {"name": "VarMalformed", "content": {"value": "CachedBeforeMalformed"}}
+        ).encode("utf-8")
+
+        eb = Envbee("1__local", b"key---1")
+        self.assertEqual("CachedBeforeMalformed", eb.get_variable("VarMalformed"))
+
+        for body in ({"name": "VarMalformed"}, []):
+            mock_get.return_value.content = json.dumps(body).encode("utf-8")
+            eb = Envbee("1__local", b"key---1")
+            self.assertEqual("CachedBeforeMalformed", eb.get_variable("VarMalformed"))
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variables_malformed_cache(self, mock_get: MagicMock):
+        """Test retrieving variables from cache when the API response has no metadata."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps({"data": []}).encode("utf-8")
+
+        eb = Envbee("1__local", b"key---1")
+        variables, md = eb.get_variables()
+        self.assertEqual(md.total, len(variables))
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_iter_variables_cache(self, mock_get: MagicMock):
+        """Test that a failed page falls back to the cached variables not yielded yet."""
+        page = MagicMock(status_code=200, headers={})
+        page.content = json.dumps(
+            {
+                "metadata": {"limit": 2, "offset": 0, "total": 4},
+                "data": [
+                    {"name": "ITC1", "content": {"value": "VALUE1"}},
+                    {"name": "ITC2", "content": {"value": "VALUE2"}},
+                ],
+            }
+        ).encode("utf-8")
+        mock_get.side_effect = [page, MagicMock(status_code=500, headers={})]
+
+        eb = Envbee("1__local", b"key---1")
+        cached, _ = eb._get_variables_from_cache(0, None)
+        names = [v["name"] for v in eb.iter_variables(page_size=2)]
+        self.assertEqual(["ITC1", "ITC2"], names[:2])
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual({v["name"] for v in cached} | {"ITC1", "ITC2"}, set(names))
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_iter_variables_capped_page(self, mock_get: MagicMock):
+        """Test iterating when the API returns smaller pages than requested."""
+        responses = []
+        for offset, names in ((0, ["CAP1", "CAP2"]), (2, ["CAP3", "CAP4"])):
+            response = MagicMock(status_code=200, headers={})
+            response.content = json.dumps(
+                {
+                    "metadata": {"limit": 2, "offset": offset, "total": 4},
+                    "data": [{"name": n, "content": {"value": n}} for n in names],
+                }
+            ).encode("utf-8")
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        eb = Envbee("1__local", b"key---1")
+        variables = list(eb.iter_variables(page_size=3))
+        self.assertEqual(
+            ["CAP1", "CAP2", "CAP3", "CAP4"], [v["name"] for v in variables]
+        )
+
+    def test_recall_variable_expired(self):
+        """Test that expired in-memory entries are dropped without touching fresh ones."""
+        eb = Envbee("1__local", b"key---1")
+        with patch("envbee_sdk.main.time.monotonic", return_value=0.0):
+            eb._remember_variable("VarExpired", {"value": "Old"})
+        with patch("envbee_sdk.main.time.monotonic", return_value=3600.0):
+            self.assertIsNone(eb._recall_variable("VarExpired"))
+            eb._remember_variable("VarExpired", {"value": "New"})
+            self.assertEqual(
+                ({"value": "New"}, None), eb._recall_variable("VarExpired")
+            )
+
+    @patch("envbee_sdk.main.requests.Session.get")
+    def test_get_variable_not_cached(self, mock_get: MagicMock):
+        """Test that a variable that is neither reachable nor cached returns None quietly."""
+        mock_get.return_value.status_code = 500
+        mock_get.return_value.headers = {}
+
+        eb = Envbee("1__local", b"key---1")
+        with self.assertLogs("envbee_sdk", level=logging.WARNING) as logs:
+            self.assertIsNone(eb.get_variable("VarNeverCached"))
+        # Only the failed request itself is logged as an error, without tracebacks
+        errors = [r for r in logs.records if r.levelno >= logging.ERROR]
+        self.assertEqual(1, len(errors))
+        self.assertIn("status code", errors[0].getMessage())
+        self.assertFalse([r for r in logs.records if r.exc_info])
+
+    def test_cache_size_limit_across_clients(self):
+        """Test that the cache size limit holds for clients that are never closed."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        settings = {"size_limit": 256 * 1024}
+        with patch(
+            "envbee_sdk.main.platformdirs.user_cache_dir", return_value=cache_dir
+        ), patch.dict(Envbee._Envbee__CACHE_SETTINGS, settings):
+            eb = Envbee("1__local", b"key---1")
+            for i in range(100):
+                eb._cache_variable(f"VarLarge{i}", {"value": "x" * 10000})
+            self.assertGreater(eb._Envbee__cache.volume(), settings["size_limit"])
+
+            eb = Envbee("1__local", b"key---1")
+            self.assertLessEqual(eb._Envbee__cache.volume(), settings["size_limit"])
+            self.assertGreater(len(eb._Envbee__cache), 0)
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from envbee_sdk.utils import add_querystring
+
+
+class Test(TestCase):
+    """Test suite for the envbee SDK utilities."""
+
+    def test_add_querystring_simple(self):
+        """Test adding parameters to a URL without a query string."""
+        self.assertEqual(
+            "/v1/variables?offset=10&limit=5",
+            add_querystring("/v1/variables", {"offset": 10, "limit": 5}),
+        )
+        self.assertEqual("/v1/variables", add_querystring("/v1/variables", {}))
+
+    def test_add_querystring_existing_query(self):
+        """Test merging parameters into a URL that already has a query string."""
+        self.assertEqual(
+            "/v1/variables?offset=1&limit=5#top",
+            add_querystring("/v1/variables?offset=0#top", {"offset": 1, "limit": 5}),
+        )